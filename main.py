@@ -14,33 +14,63 @@ No ads. No affiliate. No scheduling. No background automation.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import hashlib
+import html
+import io
 import json
 import os
 import re
+import shutil
 import sys
-from dataclasses import dataclass
+import unicodedata
+import zipfile
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+from xml.etree import ElementTree as ET
 
-import feedparser
-import requests
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from slugify import slugify
+# feedparser / requests / jinja2 are imported inside the functions that use them,
+# so --selftest only pays for stdlib imports.
+if TYPE_CHECKING:
+    import requests
+    from jinja2 import BaseLoader, Environment, Template
+
+try:  # optional: faster JSON; stdlib json is used when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
 
 
 ROOT = Path(__file__).resolve().parent
 CONFIG_PATH = ROOT / "config.json"
 CONFIG_EXAMPLE_PATH = ROOT / "config.example.json"
 LITE_LOCK_PATH = ROOT / ".lite_lock.json"
+FEED_STATE_PATH = ROOT / ".feed_state.json"  # ETag/Last-Modified of the last successful run
 
 TEMPLATES_DIR = ROOT / "templates"
+JINJA_CACHE_DIR = ROOT / ".jinja_cache"  # Compiled template bytecode (safe to delete)
+COMPILED_TEMPLATES_PATH = ROOT / "_compiled_templates.zip"  # Optional AOT build (main.py --precompile)
+COMPILED_TEMPLATES_DIGEST_NAME = "templates.digest"  # templates/ content hash stored inside the zip
 ASSETS_SRC_DIR = ROOT / "assets"  # Source assets shipped with the tool
 ASSETS_OUT_DIR = ROOT / "assets"  # Output assets (same path for Pages root)
 
 POSTS_DIR = ROOT / "posts"
 
+USER_AGENT = "AutoRSSLite/1.0"
+
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>", re.I | re.S)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Latin letters that NFKD does not decompose into ASCII (applied after lowercasing)
+_SLUG_TRANSLIT = str.maketrans({"ß": "ss", "æ": "ae", "ø": "o", "œ": "oe", "ł": "l", "đ": "d", "þ": "th", "ð": "d"})
+
+_ENV: Optional[Environment] = None
+_SESSION: Optional[requests.Session] = None
+
 
 # -----------------------------
 # Utilities
@@ -55,12 +85,14 @@ def die(msg: str, code: int = 1) -> None:
 
 
 def read_json(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def write_text(path: Path, s: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(s, encoding="utf-8")
+def write_utf8(path: Path, s: str) -> None:
+    # Encode once and write in binary mode (no newline translation).
+    write_bytes(path, s.encode("utf-8"))
 
 
 def write_bytes(path: Path, b: bytes) -> None:
@@ -68,20 +100,31 @@ def write_bytes(path: Path, b: bytes) -> None:
     path.write_bytes(b)
 
 
+def write_json(path: Path, payload: Dict[str, Any]) -> None:
+    if orjson is not None:
+        write_bytes(path, orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    write_utf8(path, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+
+
 def normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _WS_RE.sub(" ", (s or "").strip())
 
 
-def strip_tags(html: str) -> str:
-    return normalize_ws(re.sub(r"(?is)<[^>]+>", " ", html or ""))
+def strip_tags(s: str) -> str:
+    return normalize_ws(_TAG_RE.sub(" ", s or ""))
 
 
 def safe_filename(s: str) -> str:
-    return slugify(s)[:80] or "post"
+    # ASCII slug: transliterate ß/æ/ø/..., strip accents (NFKD), collapse everything else to "-".
+    s = (s or "").lower().translate(_SLUG_TRANSLIT)
+    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    return _SLUG_RE.sub("-", s).strip("-")[:80].rstrip("-") or "post"
 
 
-def sha1(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()
+def fingerprint(s: str) -> str:
+    # Change detection only (not security): BLAKE2b has less per-call overhead than sha1 on short strings.
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=20).hexdigest()
 
 
 # -----------------------------
@@ -156,6 +199,31 @@ def load_config() -> AppConfig:
     )
 
 
+# -----------------------------
+# HTTP
+# -----------------------------
+def http_session() -> requests.Session:
+    """
+    Return the shared Session (keep-alive, so RSS + DeepSeek reuse connections).
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # let callers report the final HTTP status
+        )
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        _SESSION.headers["User-Agent"] = USER_AGENT
+    return _SESSION
+
+
 # -----------------------------
 # DeepSeek (OpenAI-compatible)
 # -----------------------------
@@ -178,7 +246,7 @@ def deepseek_chat(api_key: str, model: str, temperature: float, max_tokens: int,
         "max_tokens": max_tokens,
     }
 
-    r = requests.post(url, headers=headers, json=payload, timeout=60)
+    r = http_session().post(url, headers=headers, json=payload, timeout=60)
     if r.status_code != 200:
         die(f"DeepSeek API error: HTTP {r.status_code}\n{r.text[:800]}", code=3)
 
@@ -192,13 +260,26 @@ def deepseek_chat(api_key: str, model: str, temperature: float, max_tokens: int,
 # -----------------------------
 # RSS
 # -----------------------------
-def fetch_latest_item(rss_url: str) -> Dict[str, Any]:
+def fetch_latest_item(rss_url: str, etag: str = "", modified: str = "") -> Optional[Dict[str, Any]]:
     """
     Fetch RSS and return the latest entry.
+
+    Sends a conditional GET when etag/modified are known; returns None on HTTP 304 (feed unchanged).
     """
-    r = requests.get(rss_url, timeout=30, headers={"User-Agent": "AutoRSSLite/1.0"})
+    headers = {"Accept-Encoding": "gzip, deflate"}  # requests decompresses transparently
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    import feedparser
+
+    r = http_session().get(rss_url, timeout=30, headers=headers)
+    if r.status_code == 304:
+        return None
     r.raise_for_status()
-    feed = feedparser.parse(r.text)
+    # Hand feedparser the raw bytes: it picks the encoding from the XML declaration / Content-Type itself.
+    feed = feedparser.parse(r.content, response_headers={"content-type": r.headers.get("Content-Type", "")})
 
     if not feed.entries:
         die("RSS has no entries.", code=4)
@@ -218,6 +299,8 @@ def fetch_latest_item(rss_url: str) -> Dict[str, Any]:
         "summary": summary,
         "published": published,
         "rss_url": rss_url,
+        "etag": r.headers.get("ETag", ""),
+        "last_modified": r.headers.get("Last-Modified", ""),
         "_raw_entry": e,
     }
 
@@ -225,16 +308,83 @@ def fetch_latest_item(rss_url: str) -> Dict[str, Any]:
 # -----------------------------
 # Rendering
 # -----------------------------
-def jinja_env() -> Environment:
-    if not TEMPLATES_DIR.exists():
-        die(f"templates/ folder missing: {TEMPLATES_DIR}", code=5)
+def new_jinja_env(loader: BaseLoader) -> Environment:
+    from jinja2 import Environment, FileSystemBytecodeCache, select_autoescape
 
+    JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     return Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        loader=loader,
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,  # one-shot build: templates never change mid-run
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR), pattern="__jinja2_%s.cache"),
     )
 
 
+def templates_digest() -> str:
+    """
+    Content hash of every file in templates/ (names + bytes), independent of mtimes.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for p in sorted(TEMPLATES_DIR.rglob("*")):
+        if p.is_file():
+            h.update(p.relative_to(TEMPLATES_DIR).as_posix().encode("utf-8") + b"\0")
+            h.update(p.read_bytes() + b"\0")
+    return h.hexdigest()
+
+
+def compiled_templates_fresh() -> bool:
+    """
+    True if _compiled_templates.zip exists and was built from the current templates/ contents.
+    (Compares the content hash stored by --precompile; mtimes are unreliable after git checkout.)
+    """
+    if not COMPILED_TEMPLATES_PATH.exists():
+        return False
+    try:
+        with zipfile.ZipFile(COMPILED_TEMPLATES_PATH) as zf:
+            built_from = zf.read(COMPILED_TEMPLATES_DIGEST_NAME).decode("ascii")
+    except (KeyError, OSError, zipfile.BadZipFile):
+        return False
+    return built_from == templates_digest()
+
+
+def jinja_env() -> Environment:
+    """
+    Return the shared Environment (built once, so compiled templates are reused).
+    Uses the precompiled _compiled_templates.zip when it is up to date; otherwise
+    templates/ is compiled, with bytecode persisted to .jinja_cache/ for reruns.
+    """
+    global _ENV
+    if _ENV is None:
+        if not TEMPLATES_DIR.exists():
+            die(f"templates/ folder missing: {TEMPLATES_DIR}", code=5)
+
+        from jinja2 import FileSystemLoader, ModuleLoader
+
+        if compiled_templates_fresh():
+            _ENV = new_jinja_env(ModuleLoader(str(COMPILED_TEMPLATES_PATH)))
+        else:
+            _ENV = new_jinja_env(FileSystemLoader(str(TEMPLATES_DIR)))
+    return _ENV
+
+
+def precompile_templates() -> None:
+    """
+    Compile templates/ ahead of time into _compiled_templates.zip.
+    Rerun after editing templates (a zip built from other template contents is ignored).
+    """
+    if not TEMPLATES_DIR.exists():
+        die(f"templates/ folder missing: {TEMPLATES_DIR}", code=5)
+
+    from jinja2 import FileSystemLoader
+
+    env = new_jinja_env(FileSystemLoader(str(TEMPLATES_DIR)))
+    env.compile_templates(str(COMPILED_TEMPLATES_PATH), zip="deflated", ignore_errors=False)
+    with zipfile.ZipFile(COMPILED_TEMPLATES_PATH, "a") as zf:
+        zf.writestr(COMPILED_TEMPLATES_DIGEST_NAME, templates_digest())
+    print(f"PRECOMPILED {COMPILED_TEMPLATES_PATH.name}")
+
+
 def build_robots(base_url: str) -> str:
     return f"""User-agent: *
 Allow: /
@@ -243,13 +393,20 @@ Sitemap: {base_url}/sitemap.xml
 """
 
 
-def build_sitemap(urls: list[str]) -> str:
-    items = "\n".join([f"<url><loc>{u}</loc></url>" for u in urls])
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{items}
-</urlset>
-"""
+def build_sitemap(urls: Iterable[str]) -> bytes:
+    # ElementTree escapes URLs (e.g. "&") and serializes in C.
+    root = ET.Element("urlset", {"xmlns": "http://www.sitemaps.org/schemas/sitemap/0.9"})
+    for u in urls:
+        ET.SubElement(ET.SubElement(root, "url"), "loc").text = u
+    return b'<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(root, encoding="utf-8", xml_declaration=False) + b"\n"
+
+
+def copy_asset(src: Path, dst: Path) -> None:
+    # Byte copy (sendfile/copy_file_range on Linux); nothing to do when output == source.
+    if src.resolve() == dst.resolve():
+        return
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, dst)
 
 
 def copy_assets() -> None:
@@ -258,12 +415,18 @@ def copy_assets() -> None:
     if not css.exists():
         die("assets/style.css missing.", code=5)
     # Overwrite (generated output)
-    write_text(ASSETS_OUT_DIR / "style.css", css.read_text(encoding="utf-8"))
+    copy_asset(css, ASSETS_OUT_DIR / "style.css")
 
     # Optional app.js
     appjs = ASSETS_SRC_DIR / "app.js"
     if appjs.exists():
-        write_text(ASSETS_OUT_DIR / "app.js", appjs.read_text(encoding="utf-8"))
+        copy_asset(appjs, ASSETS_OUT_DIR / "app.js")
+
+
+def render_to_file(tpl: Template, path: Path, **ctx: Any) -> None:
+    # Stream chunks straight to disk instead of building the whole page as one str.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tpl.stream(**ctx).dump(str(path), encoding="utf-8")
 
 
 def render_site(cfg: AppConfig, item: Dict[str, Any], body_html: str) -> Tuple[str, str]:
@@ -294,8 +457,10 @@ def render_site(cfg: AppConfig, item: Dict[str, Any], body_html: str) -> Tuple[s
     slug = safe_filename(item["title"])
     post_rel = f"posts/{slug}.html"
 
-    post_url = cfg.site.base_url + "/" + post_rel
-    index_url = cfg.site.base_url + "/index.html"
+    base = cfg.site.base_url
+    base_slash = base + "/"
+    post_url = base_slash + post_rel
+    index_url = base_slash + "index.html"
 
     post_obj = {
         "slug": slug,
@@ -308,20 +473,25 @@ def render_site(cfg: AppConfig, item: Dict[str, Any], body_html: str) -> Tuple[s
 
     # index
     tpl_index = env.get_template("index.html")
-    index_html = tpl_index.render(
+    render_to_file(
+        tpl_index,
+        ROOT / "index.html",
         site_title=cfg.site.title,
         site_description=cfg.site.description,
-        base_url=cfg.site.base_url,
+        base_url=base,
         generated_at=datetime.now(timezone.utc),
         posts=[post_obj],
     )
-    write_text(ROOT / "index.html", index_html)
 
     # post
     tpl_post = env.get_template("post.html")
-    post_html = tpl_post.render(
+    # The shipped template uses post.summary and post.url; we inject body_html by replacing a placeholder div
+    # If the template already contains {{ post.body_html|safe }}, it will be used directly.
+    render_to_file(
+        tpl_post,
+        ROOT / post_rel,
         site_title=cfg.site.title,
-        base_url=cfg.site.base_url,
+        base_url=base,
         post={
             **post_obj,
             "summary": post_obj["summary"],
@@ -332,14 +502,10 @@ def render_site(cfg: AppConfig, item: Dict[str, Any], body_html: str) -> Tuple[s
         },
     )
 
-    # The shipped template uses post.summary and post.url; we inject body_html by replacing a placeholder div
-    # If the template already contains {{ post.body_html|safe }}, it will be used directly.
-    write_text(ROOT / post_rel, post_html)
-
     # robots/sitemap
-    urls = [cfg.site.base_url + "/", cfg.site.base_url + "/index.html", post_url]
-    write_text(ROOT / "robots.txt", build_robots(cfg.site.base_url))
-    write_text(ROOT / "sitemap.xml", build_sitemap(urls))
+    urls = [base_slash, index_url, post_url]
+    write_utf8(ROOT / "robots.txt", build_robots(base))
+    write_bytes(ROOT / "sitemap.xml", build_sitemap(urls))
 
     return post_rel, post_url
 # Lite lock
@@ -363,9 +529,133 @@ def write_lite_lock(post_url: str) -> None:
     payload = {
         "created_utc": now_utc_iso(),
         "post_url": post_url,
-        "note": "Lite one-shot lock. Delete this file if you are the author and want to rerun locally.",
+        "note": (
+            "Lite one-shot lock. Delete this file if you are the author and want to rerun locally. "
+            "A rerun is skipped while the RSS item, config.json and templates/ are unchanged "
+            "(see .feed_state.json); use --force to regenerate anyway."
+        ),
+    }
+    write_json(LITE_LOCK_PATH, payload)
+
+
+# -----------------------------
+# Feed state (conditional GET)
+# -----------------------------
+def read_feed_state(rss_url: str) -> Dict[str, Any]:
+    """
+    Best-effort: return the saved state for this RSS URL, or {} if missing/unreadable/for another feed.
+    """
+    if not FEED_STATE_PATH.exists():
+        return {}
+    try:
+        data = read_json(FEED_STATE_PATH)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("rss_url") != rss_url:
+        return {}
+    return data
+
+
+def item_fingerprint(item: Dict[str, Any]) -> str:
+    return fingerprint(item["link"] + "\x1f" + item["title"] + "\x1f" + item["published"])
+
+
+def inputs_fingerprint(cfg: AppConfig) -> str:
+    """
+    Fingerprint of everything besides the RSS item that shapes the output (config + templates).
+    """
+    return fingerprint(json.dumps(asdict(cfg), sort_keys=True) + "\x1f" + templates_digest())
+
+
+def write_feed_state(item: Dict[str, Any], post_url: str, inputs: str) -> None:
+    payload = {
+        "rss_url": item["rss_url"],
+        "fingerprint": item_fingerprint(item),
+        "inputs": inputs,
+        "etag": item.get("etag", ""),
+        "last_modified": item.get("last_modified", ""),
+        "post_url": post_url,
+        "updated_utc": now_utc_iso(),
     }
-    write_text(LITE_LOCK_PATH, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+    write_json(FEED_STATE_PATH, payload)
+
+
+# -----------------------------
+# Body sanitizer
+# -----------------------------
+ALLOWED_BODY_TAGS = frozenset({"p", "h2", "ul", "li", "strong", "code", "a"})
+ALLOWED_BODY_ATTRS = {"a": frozenset({"href", "title", "rel"})}
+DROPPED_CONTENT_TAGS = frozenset({"script", "style"})
+SAFE_URL_SCHEMES = frozenset({"", "http", "https", "mailto"})
+_URL_TRIM_CHARS = "".join(chr(i) for i in range(0x21))  # C0 controls + space
+_URL_REMOVE_CHARS = str.maketrans("", "", "\t\n\r")
+
+
+def safe_href(value: str) -> Optional[str]:
+    """
+    Return the href cleaned the way browsers parse it, or None unless its scheme is allowlisted.
+    Browsers trim leading/trailing C0 controls and spaces and drop tab/LF/CR anywhere,
+    so "\x01java\tscript:" must not slip through; other characters are kept as-is.
+    """
+    value = value.strip(_URL_TRIM_CHARS).translate(_URL_REMOVE_CHARS)
+    try:
+        scheme = urlsplit(value).scheme.lower()
+    except ValueError:
+        return None
+    return value if scheme in SAFE_URL_SCHEMES else None
+
+
+class _BodySanitizer(HTMLParser):
+    """
+    Single pass over the LLM output: re-emit allowed tags/attributes, escape text, drop everything else.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.out = io.StringIO()
+        self._skip_depth = 0  # inside <script>/<style>
+
+    def _emit_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self._skip_depth or tag not in ALLOWED_BODY_TAGS:
+            return
+        allowed_attrs = ALLOWED_BODY_ATTRS.get(tag, frozenset())
+        parts = [tag]
+        for name, value in attrs:
+            if name not in allowed_attrs or value is None:
+                continue
+            if name == "href":
+                value = safe_href(value)
+                if value is None:
+                    continue
+            parts.append(f'{name}="{html.escape(value, quote=True)}"')
+        self.out.write("<" + " ".join(parts) + ">")
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag in DROPPED_CONTENT_TAGS:
+            self._skip_depth += 1
+            return
+        self._emit_starttag(tag, attrs)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag not in DROPPED_CONTENT_TAGS:
+            self._emit_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in DROPPED_CONTENT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif not self._skip_depth and tag in ALLOWED_BODY_TAGS:
+            self.out.write(f"</{tag}>")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.out.write(html.escape(data, quote=False))
+
+
+def sanitize_body_html(s: str) -> str:
+    parser = _BodySanitizer()
+    parser.feed(s or "")
+    parser.close()
+    return parser.out.getvalue()
 
 
 # -----------------------------
@@ -416,15 +706,7 @@ STRUCTURE:
     )
 
     # Safety: keep only allowed tags (very lightweight sanitizer)
-    allowed = {"p", "h2", "ul", "li", "strong", "code", "a"}
-    # remove script/style tags and their content
-    out = re.sub(r"(?is)<(script|style)[^>]*>.*?</\1\s*>", "", out).strip()
-    # remove any other tags not in allowed
-    def _strip_disallowed(m: re.Match) -> str:
-        tag = (m.group(1) or "").lower()
-        return m.group(0) if tag in allowed else ""
-
-    out = re.sub(r"(?is)</?([a-z0-9]+)(\s+[^>]*)?>", _strip_disallowed, out)
+    out = sanitize_body_html(out).strip()
 
     if not out:
         out = "<p><strong>Summary</strong>: Not stated in the source.</p>"
@@ -447,27 +729,75 @@ def selftest() -> None:
         die("templates/post.html missing.", code=5)
     if not (ASSETS_SRC_DIR / "style.css").exists():
         die("assets/style.css missing.", code=5)
+    for bad in (
+        '<a href="javascript:alert(1)">l</a>',
+        '<a href="java&#x09;script:alert(1)">l</a>',
+        '<a href="java&#10;script:alert(1)">l</a>',
+        '<a href="\x01javascript:alert(1)">l</a>',
+        '<a href=" JaVaScRiPt:alert(1)">l</a>',
+        '<a href="data:text/html,x">l</a>',
+    ):
+        if "href" in sanitize_body_html(bad):
+            die(f"sanitizer kept an unsafe href: {bad!r}", code=5)
+    if sanitize_body_html('<a href="https://example.com/?a=1&amp;b=2">l</a>') != '<a href="https://example.com/?a=1&amp;b=2">l</a>':
+        die("sanitizer dropped a safe href.", code=5)
+    if sanitize_body_html('<a href=" /path with space ">l</a>') != '<a href="/path with space">l</a>':
+        die("sanitizer mangled a safe href.", code=5)
     print("SELFTEST OK")
 
 
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--selftest", action="store_true", help="run quick sanity checks")
+    ap.add_argument("--precompile", action="store_true", help="compile templates/ into _compiled_templates.zip")
+    ap.add_argument("--force", action="store_true", help="regenerate even if nothing changed since the last run")
     args = ap.parse_args()
 
     if args.selftest:
         selftest()
         return
 
+    if args.precompile:
+        precompile_templates()
+        return
+
     check_lite_lock()
     cfg = load_config()
 
-    item = fetch_latest_item(cfg.rss_url)
-    body_html = generate_body_html(cfg, item)
+    inputs = inputs_fingerprint(cfg)
+    state = {} if args.force else read_feed_state(cfg.rss_url)
+    if state.get("inputs") != inputs:
+        # Config or templates changed since the last run: fetch unconditionally so the site is re-rendered.
+        state = {}
+    item = fetch_latest_item(cfg.rss_url, etag=str(state.get("etag") or ""), modified=str(state.get("last_modified") or ""))
+    if item is None:
+        # HTTP 304 for unchanged inputs: the site already reflects this feed; skip the LLM call and the render.
+        write_lite_lock(str(state.get("post_url") or ""))
+        print("UNCHANGED (RSS not modified since last run; use --force to regenerate)")
+        print(f"Post: {state.get('post_url')}")
+        return
+
+    if state.get("fingerprint") == item_fingerprint(item):
+        # Same latest entry, config and templates as last run: the site is already current.
+        # Still save the fresh ETag/Last-Modified so the next run can get a 304.
+        write_feed_state(item, str(state.get("post_url") or ""), inputs)
+        write_lite_lock(str(state.get("post_url") or ""))
+        print("UNCHANGED (latest RSS item already generated; use --force to regenerate)")
+        print(f"Post: {state.get('post_url')}")
+        return
+
+    # The DeepSeek call is I/O bound: overlap it with asset copying and template loading.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        body_future = pool.submit(generate_body_html, cfg, item)
+        copy_assets()
+        env = jinja_env()
+        env.get_template("index.html")
+        env.get_template("post.html")
+        body_html = body_future.result()
 
-    copy_assets()
     _post_rel, post_url = render_site(cfg, item, body_html)
     write_lite_lock(post_url)
+    write_feed_state(item, post_url, inputs)
 
     print("DONE")
     print(f"Post: {post_url}")